@@ -3,10 +3,11 @@ Main module for the FastAPI application.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.routes import router
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.include_router(router)
 
@@ -2,28 +2,47 @@
 This module contains the FastAPI routes for the car booking API.
 """
 
-from typing import Optional
+from datetime import date, time
+from typing import Annotated, Any, Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, Field, model_validator
 
-from app.services import check_car_availability, create_booking, list_cars
+from app.services import check_car_availability, create_booking, list_cars_with_version
 
 router = APIRouter()
 
+# Encoded body of the last `/cars/` response and the version of the cars file it was
+# encoded from, which changes when the file is rewritten or records are appended to it.
+_cars_response: dict[str, Any] = {}
+
+# Range of the dates accepted by the API. The availability bitmaps span the days from the
+# earliest booking, so a single date centuries away would make every bitmap as long.
+_MIN_DATE = date(2000, 1, 1)
+_MAX_DATE = date(2099, 12, 31)
+_Date = Annotated[date, Field(ge=_MIN_DATE, le=_MAX_DATE)]
+
 
 class BookingRequest(BaseModel):
     """Pydantic model for the booking request."""
 
     car_id: int
-    start_date: str
-    end_date: str
-    pickup_time: str
-    dropoff_time: str
+    start_date: _Date
+    end_date: _Date
+    pickup_time: time
+    dropoff_time: time
+
+    @model_validator(mode="after")
+    def check_date_range(self) -> "BookingRequest":
+        """Reject a booking ending before it starts."""
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
 
 
 @router.get("/cars/")
-def get_all_cars() -> dict:
+async def get_all_cars() -> Response:
     """
     Endpoint to list the company's car fleet.
 
@@ -31,7 +50,8 @@ def get_all_cars() -> dict:
     - None
 
     **Returns:**
-    A dictionary containing the list of all cars in the company's fleet
+    A dictionary containing the list of all cars in the company's fleet. The encoded
+    response is reused until the car fleet changes.
 
     **Example Request:**
     ```
@@ -50,15 +70,17 @@ def get_all_cars() -> dict:
         is raised with status code 500 and the error message.
     """
     try:
-        cars = list_cars()
-        return {"cars": cars}
+        version, cars = await list_cars_with_version()
+        if _cars_response.get("version") != version:
+            _cars_response.update(version=version, body=orjson.dumps({"cars": cars}))
+        return Response(content=_cars_response["body"], media_type="application/json")
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.get("/check_car_availability")
-def check_availability(
-    start_date: str, end_date: str, car_model: Optional[str] = None
+async def check_availability(
+    start_date: _Date, end_date: _Date, car_model: Optional[str] = None
 ) -> dict:
     """
     Endpoint to check the availability of cars for a given date range and optional car model.
@@ -66,8 +88,8 @@ def check_availability(
     This endpoint checks the availability of cars based on the provided start and end dates.
     Optionally, a specific car model can be provided to filter the results.
 
-    - `start_date` (str): The start date for the booking (in "YYYY-MM-DD" format). \n
-    - `end_date` (str): The end date for the booking (in "YYYY-MM-DD" format).
+    - `start_date` (date): The start date for the booking (in "YYYY-MM-DD" format). \n
+    - `end_date` (date): The end date for the booking (in "YYYY-MM-DD" format).
     - `car_model` Optional[str]: The optional car model to check for availability. If not provided,
                                     all car models will be considered.
 
@@ -98,10 +120,16 @@ def check_availability(
     ```
 
     **Raises:**
+    - `HTTPException`: If the end date is before the start date, a 422 error is raised.
     - `HTTPException`: If no cars are available for the given dates and model, a 404 error is raised
                        with the message "No available cars found for the given dates and model."
     """
-    available_cars = check_car_availability(start_date, end_date, car_model)
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=422, detail="end_date must not be before start_date"
+        )
+
+    available_cars = await check_car_availability(start_date, end_date, car_model)
 
     if not available_cars:
         raise HTTPException(
@@ -113,7 +141,7 @@ def check_availability(
 
 
 @router.post("/booking/")
-def post_booking(booking: BookingRequest) -> dict:
+async def post_booking(booking: BookingRequest) -> dict:
     """
     Create a car booking for a specified date and time range.
 
@@ -129,7 +157,7 @@ def post_booking(booking: BookingRequest) -> dict:
     there is an error.
     """
     try:
-        success = create_booking(
+        success = await create_booking(
             booking.car_id,
             booking.start_date,
             booking.end_date,
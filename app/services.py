@@ -1,14 +1,110 @@
 """ This module contains the service functions for the car booking API. """
 
-import json
+import asyncio
+import logging
+import mmap
+import os
 import pathlib
-from datetime import datetime
-from typing import Optional
+import shutil
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, time
+from typing import Any, Callable, Optional
+
+import orjson
+
+_LOGGER = logging.getLogger(__name__)
+
+# Directory of the data files, and the paths of the files used by the services,
+# resolved once so every lookup returns the same path object.
+_DB_DIR = pathlib.Path(__file__).resolve().parent / "db"
+_DB_PATHS = {
+    filename: _DB_DIR / filename for filename in ("cars.json", "bookings.json")
+}
+
+# Maximum number of records kept in the append log of a data file before the log
+# is folded back into the file.
+_MAX_LOG_RECORDS = 1000
+
+# Key of the first line of a log, holding the inode of the data file the log extends.
+# Files are only ever replaced by a compaction, so a log naming another inode was left
+# behind by a compaction interrupted before it could delete it.
+_LOG_BASE_KEY = "_base_inode"
+
+
+@dataclass
+class _CacheEntry:
+    """Parsed content of a data file, along with the state of its log and derived views."""
+
+    version: tuple[int, int]
+    data: dict
+    log_size: int = 0
+    log_records: int = 0
+    views: dict[str, tuple[Any, Callable[..., Any]]] = field(default_factory=dict)
+
+
+# Parsed data files keyed by path. Each entry holds the file version
+# (mtime in nanoseconds and size) it was parsed from, so a change on disk
+# is picked up on the next read.
+_CACHE: dict[pathlib.Path, _CacheEntry] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Path of a data file, the version of the file and the size of its log applied to it,
+# which together identify the cached content of the file.
+_DataVersion = tuple[pathlib.Path, tuple[int, int], int]
+
+# Start ordinals of the bookings of a car and the running maximum of their end ordinals.
+_CarRanges = tuple["array[int]", "array[int]"]
+
+# Serializes the check-then-append sequence of the bookings.
+_BOOKINGS_LOCK = threading.RLock()
 
 
 def get_file_path(filename: str) -> pathlib.Path:
     """Return the absolute file path based on the filename."""
-    return pathlib.Path(__file__).parent.parent / "app" / "db" / filename
+    file_path = _DB_PATHS.get(filename)
+    return file_path if file_path else _DB_DIR / filename
+
+
+def _file_version(file_path: pathlib.Path) -> tuple[int, int]:
+    """Return the modification time and size of a file, used to detect changes."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _log_path(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the path of the append log of a data file."""
+    return file_path.with_suffix(".ndjson")
+
+
+def _save_data(file_path: pathlib.Path, data: dict) -> None:
+    """Write a data file and drop its log, whose records are part of `data`."""
+    # Write a new file and swap it in rather than truncating the current one, which
+    # may be memory mapped by a reader: truncating it under the mapping crashes it
+    fd, temp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            file.flush()
+            # The content must be on disk before the file takes the place of the old one
+            os.fsync(file.fileno())
+        # `mkstemp` creates the file readable by its owner only: keep the current mode
+        try:
+            shutil.copymode(file_path, temp_path)
+        except FileNotFoundError:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    _log_path(file_path).unlink(missing_ok=True)
+    _CACHE[file_path] = _CacheEntry(_file_version(file_path), data)
 
 
 def save_data(file_path: pathlib.Path, data: dict) -> None:
@@ -18,22 +114,392 @@ def save_data(file_path: pathlib.Path, data: dict) -> None:
     :param file_path: Path to the file where data will be saved.
     :param data: Data to be saved in the JSON format.
     """
-    with open(file_path, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4)
+    with _CACHE_LOCK:
+        _save_data(file_path, data)
+
+
+def _log_size(file_path: pathlib.Path) -> int:
+    """Return the size of the append log of a data file, 0 if there is none."""
+    try:
+        return _log_path(file_path).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _parse_log_lines(file_path: pathlib.Path, chunk: bytes) -> dict[str, list]:
+    """Group the records of complete log lines by the key of the list they extend."""
+    appended: dict[str, list] = {}
+    for line in chunk.splitlines():
+        try:
+            line_records = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # A line garbled by a crashed write: losing it beats failing every read
+            _LOGGER.warning("Skipping an unreadable line of %s", _log_path(file_path))
+            continue
+
+        for key, record in line_records.items():
+            if key != _LOG_BASE_KEY:
+                appended.setdefault(key, []).append(record)
+
+    return appended
+
+
+def _replay_log(file_path: pathlib.Path, entry: _CacheEntry, log_size: int) -> None:
+    """Apply the records appended to the log of a file since it was last read."""
+    with open(_log_path(file_path), "rb") as log:
+        log.seek(entry.log_size)
+        chunk = log.read(log_size - entry.log_size)
+
+    # Leave a line still being written for the next read
+    chunk = chunk[: chunk.rfind(b"\n") + 1]
+    appended = _parse_log_lines(file_path, chunk)
+
+    # Apply the chunk to the entry only once every view took it, so that a failure
+    # leaves the chunk to be replayed whole by the next read
+    views = {}
+    try:
+        for name, (view, build) in entry.views.items():
+            views[name] = (build(appended, view), build)
+    except Exception:
+        # Views are updated in place and may hold part of the chunk: drop them, they
+        # are built again from the data when next loaded
+        entry.views.clear()
+        raise
+
+    for key, records in appended.items():
+        entry.data.setdefault(key, []).extend(records)
+    entry.views.update(views)
+    entry.log_records += sum(len(records) for records in appended.values())
+    # Moved last, so that `_fresh_entry` only sees the entry as up to date once
+    # the records are applied
+    entry.log_size += len(chunk)
+
+
+def _is_stale_log(file_path: pathlib.Path) -> bool:
+    """Return whether the log of a data file extends a file it was since replaced by."""
+    with open(_log_path(file_path), "rb") as log:
+        first_line = log.readline()
+
+    try:
+        base_inode = orjson.loads(first_line).get(_LOG_BASE_KEY)
+    except (orjson.JSONDecodeError, AttributeError):
+        return False
+    return base_inode is not None and base_inode != file_path.stat().st_ino
+
+
+def _read_json(file_path: pathlib.Path) -> dict:
+    """Parse a JSON file straight from a memory map of it, without copying it first."""
+    with open(file_path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            # Empty files cannot be mapped, let the parser report them
+            return orjson.loads(b"")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as content:
+                return orjson.loads(content)
+
+
+def _cache_entry(file_path: pathlib.Path) -> _CacheEntry:
+    """Return the cache entry of a file, reading again what changed on disk."""
+    version = _file_version(file_path)
+    log_size = _log_size(file_path)
+    entry = _CACHE.get(file_path)
+    # A log shorter than what was read means it was replaced: start over from the file
+    if not entry or entry.version != version or log_size < entry.log_size:
+        entry = _CacheEntry(version, _read_json(file_path))
+        _CACHE[file_path] = entry
+        if log_size and _is_stale_log(file_path):
+            # Its records are already part of the file
+            _log_path(file_path).unlink()
+            log_size = 0
+
+    if log_size > entry.log_size:
+        _replay_log(file_path, entry, log_size)
+
+    return entry
 
 
 def load_data(file_path: pathlib.Path) -> dict:
     """
     Load data from a JSON file.
 
+    The parsed data is cached in memory and only re-read when the file changes on disk.
+    Records appended to the file log are applied on top of it.
+
+    :param file_path: Path to the JSON file to load data from.
+    :return: Data loaded from the JSON file.
+    """
+    return _load_entry(file_path).data
+
+
+def _load_entry(file_path: pathlib.Path) -> _CacheEntry:
+    """Return the cache entry of a file, taking the cache lock."""
+    with _CACHE_LOCK:
+        return _cache_entry(file_path)
+
+
+def _fresh_entry(file_path: pathlib.Path) -> Optional[_CacheEntry]:
+    """
+    Return the cache entry of a file if it is up to date with the disk, else None.
+
+    This does not take `_CACHE_LOCK`, so the event loop never waits on a worker thread
+    reading a file.
+    """
+    entry = _CACHE.get(file_path)
+    if (
+        entry
+        and entry.version == _file_version(file_path)
+        and entry.log_size == _log_size(file_path)
+    ):
+        return entry
+    return None
+
+
+async def load_data_async(file_path: pathlib.Path) -> dict:
+    """
+    Load data from a JSON file without blocking the event loop.
+
+    Cached data is returned right away; reading a file that changed on disk happens in a
+    worker thread.
+
     :param file_path: Path to the JSON file to load data from.
     :return: Data loaded from the JSON file.
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        return json.load(file)
+    return (await _load_entry_async(file_path)).data
+
+
+async def _load_entry_async(file_path: pathlib.Path) -> _CacheEntry:
+    """Return the cache entry of a file, reading what changed on disk in a worker thread."""
+    entry = _fresh_entry(file_path)
+    if entry:
+        return entry
+
+    return await asyncio.to_thread(_load_entry, file_path)
+
+
+def append_data(file_path: pathlib.Path, key: str, record: dict) -> None:
+    """
+    Append a record to a list of a JSON file without rewriting the file.
+
+    The record is written as one line to the log next to the file (``.ndjson``) and
+    replayed on top of the file when it is loaded. Once the log grows past
+    `_MAX_LOG_RECORDS` records it is folded back into the file.
+
+    :param file_path: Path to the JSON file the record belongs to.
+    :param key: Key of the list the record is appended to.
+    :param record: Record to append.
+    """
+    with _CACHE_LOCK:
+        entry = _cache_entry(file_path)
+        with open(_log_path(file_path), "ab") as log:
+            # Anything past the lines just replayed is a line cut short by a crashed
+            # write: drop it rather than write the record onto the end of it
+            if log.tell() > entry.log_size:
+                log.truncate(entry.log_size)
+            if not entry.log_size:
+                log.write(
+                    orjson.dumps({_LOG_BASE_KEY: file_path.stat().st_ino}) + b"\n"
+                )
+            log.write(orjson.dumps({key: record}) + b"\n")
+            # The record must be on disk before the caller reports it saved
+            log.flush()
+            os.fsync(log.fileno())
+
+        _replay_log(file_path, entry, _log_size(file_path))
+        if entry.log_records > _MAX_LOG_RECORDS:
+            _save_data(file_path, entry.data)
+
+
+def compact_data(file_path: pathlib.Path) -> None:
+    """
+    Fold the records of the log of a JSON file back into the file.
+
+    :param file_path: Path to the JSON file to compact.
+    """
+    with _CACHE_LOCK:
+        entry = _cache_entry(file_path)
+        if entry.log_records:
+            _save_data(file_path, entry.data)
+
+
+def load_view(
+    file_path: pathlib.Path, name: str, build: Callable[[dict, Any], Any]
+) -> Any:
+    """
+    Load a structure derived from the data of a JSON file.
+
+    The view is built once from the cached data with ``build(data, None)``. Records
+    appended to the file later are folded in with ``build(appended_data, view)``, and
+    the view is rebuilt from scratch when the file itself changes.
+
+    :param file_path: Path to the JSON file the view is derived from.
+    :param name: Name identifying the view among the views of the same file.
+    :param build: Function building the view from the file data.
+    :return: The derived view.
+    """
+    with _CACHE_LOCK:
+        entry = _cache_entry(file_path)
+        if name not in entry.views:
+            entry.views[name] = (build(entry.data, None), build)
+        return entry.views[name][0]
+
+
+async def load_view_async(
+    file_path: pathlib.Path, name: str, build: Callable[[dict, Any], Any]
+) -> Any:
+    """
+    Load a structure derived from the data of a JSON file without blocking the event loop.
+
+    A view already built from up to date data is returned right away; reading the file
+    and building the view happen in a worker thread.
+
+    :param file_path: Path to the JSON file the view is derived from.
+    :param name: Name identifying the view among the views of the same file.
+    :param build: Function building the view from the file data.
+    :return: The derived view.
+    """
+    entry = _fresh_entry(file_path)
+    if entry:
+        view = entry.views.get(name)
+        if view:
+            return view[0]
+
+    return await asyncio.to_thread(load_view, file_path, name, build)
+
+
+def _cars_by_name(
+    cars_data: dict, cars_by_name: Optional[dict[str, list[dict]]]
+) -> dict[str, list[dict]]:
+    """
+    Index the cars by their lowercase name.
+
+    :param cars_data: Data loaded from the cars file.
+    :param cars_by_name: Index to add the cars to, if any.
+    :return: A dictionary mapping each lowercase car name to the cars of that model.
+    """
+    if cars_by_name is None:
+        cars_by_name = {}
+
+    for car in cars_data.get("cars", []):
+        cars_by_name.setdefault(car["name"].lower(), []).append(car)
+
+    return cars_by_name
+
+
+def _booking_ranges(bookings_data: dict) -> list[tuple[int, int, int]]:
+    """
+    Normalize the bookings into their car ID and the ordinals of their first and last day.
+
+    :param bookings_data: Data loaded from the bookings file.
+    :return: A list of ``(car_id, start_ordinal, end_ordinal)`` tuples.
+    """
+    return [
+        (
+            booking["car_id"],
+            date.fromisoformat(booking["start_date"]).toordinal(),
+            date.fromisoformat(booking["end_date"]).toordinal(),
+        )
+        for booking in bookings_data.get("bookings", [])
+    ]
+
+
+def _bookings_by_car(
+    bookings_data: dict, bookings_by_car: Optional[dict[int, _CarRanges]]
+) -> dict[int, _CarRanges]:
+    """
+    Index the booked date ranges of each car.
+
+    The ranges of a car are kept as two parallel arrays sorted by start: the start
+    ordinals, and the latest end ordinal among the ranges up to each position.
+
+    :param bookings_data: Data loaded from the bookings file.
+    :param bookings_by_car: Index to add the bookings to, if any.
+    :return: A dictionary mapping each car ID to its ``(starts, max_ends)`` arrays.
+    """
+    if bookings_by_car is None:
+        bookings_by_car = {}
+
+    for car_id, start, end in _booking_ranges(bookings_data):
+        if car_id not in bookings_by_car:
+            bookings_by_car[car_id] = (array("l"), array("l"))
+        starts, max_ends = bookings_by_car[car_id]
+
+        index = bisect_right(starts, start)
+        starts.insert(index, start)
+        max_ends.insert(index, max(max_ends[index - 1], end) if index else end)
+        # The following ranges now also follow this one
+        for position in range(index + 1, len(max_ends)):
+            if max_ends[position] >= end:
+                break
+            max_ends[position] = end
+
+    return bookings_by_car
+
+
+def _overlaps(car_ranges: _CarRanges, start: int, end: int) -> bool:
+    """Return whether any of the ranges of a car overlaps the days between two ordinals."""
+    starts, max_ends = car_ranges
+    # Among the ranges starting before the end, the one ending last decides
+    index = bisect_right(starts, end)
+    return bool(index) and max_ends[index - 1] >= start
+
+
+def _booking_bitmaps(
+    bookings_data: dict, bitmaps_view: Optional[tuple[int, dict[int, int]]]
+) -> tuple[int, dict[int, int]]:
+    """
+    Build a bitmap of the booked days of each car.
+
+    Bit ``i`` of a car bitmap is set when the car is booked on the day ``epoch + i``,
+    where ``epoch`` is the ordinal of the earliest booked day.
+
+    :param bookings_data: Data loaded from the bookings file.
+    :param bitmaps_view: Epoch and bitmaps to add the bookings to, if any.
+    :return: The epoch ordinal and a dictionary mapping each car ID to its bitmap.
+    """
+    ranges = _booking_ranges(bookings_data)
+    first_day = min((start for _, start, _ in ranges), default=0)
+    bitmaps: dict[int, int]
+    if bitmaps_view and bitmaps_view[1]:
+        epoch, bitmaps = bitmaps_view
+        if ranges and first_day < epoch:
+            # Move the epoch back to the new earliest booked day
+            shift = epoch - first_day
+            epoch, bitmaps = first_day, {
+                car_id: bitmap << shift for car_id, bitmap in bitmaps.items()
+            }
+    else:
+        # No day booked yet, e.g. bookings appended to an empty file: the epoch
+        # of the existing view is a placeholder, anchor it on these bookings
+        epoch, bitmaps = first_day, {}
+
+    for car_id, start, end in ranges:
+        bitmaps[car_id] = bitmaps.get(car_id, 0) | _days_mask(start, end, epoch)
+
+    return epoch, bitmaps
+
+
+def _days_mask(start: int, end: int, epoch: int) -> int:
+    """Return a bitmap with the bits of the days between two ordinals set."""
+    start = max(start - epoch, 0)
+    end -= epoch
+    if end < start:
+        return 0
+
+    return ((1 << (end - start + 1)) - 1) << start
+
+
+def compact_bookings() -> None:
+    """
+    Fold the bookings appended to the log back into the `bookings.json` file.
+
+    Meant for maintenance; `create_booking` also compacts the log once it grows too large.
+    """
+    with _BOOKINGS_LOCK:
+        compact_data(get_file_path("bookings.json"))
 
 
-def list_cars() -> list:
+async def list_cars() -> list:
     """
     Retrieve the list of cars from the data file.
 
@@ -45,29 +511,47 @@ def list_cars() -> list:
     :raises:
         RuntimeError: If there is an error loading the car data from the file.
     """
+    return (await list_cars_with_version())[1]
+
+
+async def list_cars_with_version() -> tuple[_DataVersion, list]:
+    """
+    Retrieve the list of cars along with a key identifying the content of the data file.
+
+    The key changes whenever the file is read again or records appended to it are applied,
+    so it can key anything derived from the list.
+
+    :return: The version key, and a list of cars or an empty list if no cars are found.
+    :raises:
+        RuntimeError: If there is an error loading the car data from the file.
+    """
     try:
-        data = load_data(get_file_path("cars.json"))
-        return data.get(
+        file_path = get_file_path("cars.json")
+        entry = await _load_entry_async(file_path)
+        # Taken before the list: records are added to the data before they are counted
+        # in the log size, so the list is never older than the key
+        version = (file_path, entry.version, entry.log_size)
+        return version, entry.data.get(
             "cars", []
         )  # Return the list of cars or an empty list if 'cars' key is not found
     except Exception as exc:
         raise RuntimeError(f"Error loading the cars: {exc}") from exc
 
 
-def create_booking(
-    car_id: int, start_date: str, end_date: str, pickup_time: str, dropoff_time: str
+async def create_booking(
+    car_id: int, start_date: date, end_date: date, pickup_time: time, dropoff_time: time
 ) -> bool:
     """
     Creates a booking for a car within a specified date range and time.
 
     This function checks if the car is available for the provided date range and creates a booking
-    if the car is not already booked. The booking is saved in the `bookings.json` file.
+    if the car is not already booked. The booking is appended to the `bookings.json` file log.
 
     :param car_id: The ID of the car to be reserved.
-    :param start_date: The start date of the booking in 'YYYY-MM-DD' format.
-    :param end_date: The end date of the booking in 'YYYY-MM-DD' format.
-    :param pickup_time: The time the car will be picked up in 'HH:MM' format.
-    :param dropoff_time: The time the car will be dropped off in 'HH:MM' format.
+    :param start_date: The start date of the booking.
+    :param end_date: The end date of the booking.
+    :param pickup_time: The time the car will be picked up.
+    :param dropoff_time: The time the car will be dropped off.
 
     :return: True if the booking is successfully created, False if the car is already booked for
               the specified time range.
@@ -76,99 +560,100 @@ def create_booking(
         ValueError: If the car with the specified ID is not found.
     """
     # Load data from files
-    cars = load_data(get_file_path("cars.json")).get("cars", [])
-    bookings_data = load_data(get_file_path("bookings.json"))
-    bookings = bookings_data.get("bookings", [])
+    cars = (await load_data_async(get_file_path("cars.json"))).get("cars", [])
 
     # Check if car exists
     car = next((car for car in cars if car["id"] == car_id), None)
     if not car:
         raise ValueError("Car not found.")
 
-    # Convert the start and end dates to datetime objects
-    start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
-    end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-
-    # Check for overlapping bookings
-    if any(
-        booking["car_id"] == car_id
-        and not (
-            end_date_obj < datetime.strptime(booking["start_date"], "%Y-%m-%d")
-            or start_date_obj > datetime.strptime(booking["end_date"], "%Y-%m-%d")
-        )
-        for booking in bookings
-    ):
-        return False
-
-    # Create and save new booking
     new_booking = {
         "car_id": car_id,
-        "start_date": start_date,
-        "end_date": end_date,
-        "pickup_time": pickup_time,
-        "dropoff_time": dropoff_time,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "pickup_time": pickup_time.isoformat(timespec="minutes"),
+        "dropoff_time": dropoff_time.isoformat(timespec="minutes"),
     }
-    bookings.append(new_booking)
-    bookings_data["bookings"] = bookings
-    save_data(get_file_path("bookings.json"), bookings_data)
+
+    # The check and the write may read, append to or compact the bookings file
+    return await asyncio.to_thread(
+        _book, car_id, start_date.toordinal(), end_date.toordinal(), new_booking
+    )
+
+
+def _book(car_id: int, start_ord: int, end_ord: int, new_booking: dict) -> bool:
+    """
+    Save a booking unless the car is already booked on any of its days.
+
+    :param car_id: The ID of the car to be reserved.
+    :param start_ord: The ordinal of the start date of the booking.
+    :param end_ord: The ordinal of the end date of the booking.
+    :param new_booking: The booking to save.
+    :return: True if the booking was saved, False if it overlaps another booking.
+    """
+    # Check and save under the lock so concurrent requests cannot book the same days
+    with _BOOKINGS_LOCK:
+        bookings_by_car = load_view(
+            get_file_path("bookings.json"), "bookings_by_car", _bookings_by_car
+        )
+
+        # Check for overlapping bookings
+        car_ranges = bookings_by_car.get(car_id)
+        if car_ranges and _overlaps(car_ranges, start_ord, end_ord):
+            return False
+
+        append_data(get_file_path("bookings.json"), "bookings", new_booking)
 
     return True
 
 
-def is_car_available(car_id: int, start_date: str, end_date: str) -> bool:
+def _requested_days(start_date: date, end_date: date, epoch: int) -> int:
+    """Return the bitmap of the days of a reservation, relative to the bitmaps epoch."""
+    return _days_mask(start_date.toordinal(), end_date.toordinal(), epoch)
+
+
+def _is_available(car_id: int, requested_days: int, bitmaps: dict[int, int]) -> bool:
+    """Return whether none of the requested days is booked in the bitmap of a car."""
+    return not bitmaps.get(car_id, 0) & requested_days
+
+
+def is_car_available(car_id: int, start_date: date, end_date: date) -> bool:
     """
     Checks if a car is available for a given date range.
 
     :param car_id: The ID of the car to check availability for.
-    :param start_date: The start date of the reservation in 'YYYY-MM-DD' format.
-    :param end_date: The end date of the reservation in 'YYYY-MM-DD' format.
+    :param start_date: The start date of the reservation.
+    :param end_date: The end date of the reservation.
     :return: `True` if the car is available, `False` if it is already booked.
     """
-    with open(get_file_path("bookings.json"), "r", encoding="utf-8") as file:
-        bookings_data = json.load(file).get("bookings", [])
-
-    # Iterate through all bookings
-    for booking in bookings_data:
-        if booking["car_id"] == car_id:
-            # Convert dates to datetime objects
-            booking_start = datetime.strptime(booking["start_date"], "%Y-%m-%d")
-            booking_end = datetime.strptime(booking["end_date"], "%Y-%m-%d")
-            requested_start = datetime.strptime(start_date, "%Y-%m-%d")
-            requested_end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            # Check for overlapping dates
-            if requested_start <= booking_end and requested_end >= booking_start:
-                return False  # The car is booked, not available
+    epoch, bitmaps = load_view(
+        get_file_path("bookings.json"), "bitmaps", _booking_bitmaps
+    )
+    return _is_available(car_id, _requested_days(start_date, end_date, epoch), bitmaps)
 
-    return True  # The car is available
 
-
-def check_car_availability(
-    start_date: str, end_date: str, car_model: Optional[str] = None
+async def check_car_availability(
+    start_date: date, end_date: date, car_model: Optional[str] = None
 ) -> list:
     """
     Checks the availability of cars for a given date range, optionally filtering by car model.
 
-    :param start_date: The start date of the reservation ('YYYY-MM-DD').
-    :param end_date: The end date of the reservation ('YYYY-MM-DD').
+    :param start_date: The start date of the reservation.
+    :param end_date: The end date of the reservation.
     :param car_model: The model of the car to check for availability (optional).
     :return: A list of available cars, each represented as a dictionary.
     """
-    with open(get_file_path("cars.json"), "r", encoding="utf-8") as file:
-        cars_data = json.load(file)
-
-    available_cars = []
-
+    # Load each file once for all the cars
+    cars = (await load_data_async(get_file_path("cars.json"))).get("cars", [])
     if car_model:
-        for car in cars_data["cars"]:
-            if car["name"].lower() == car_model.lower():
-                car_id = car["id"]
-                if is_car_available(car_id, start_date, end_date):
-                    available_cars.append(car)
-    else:
-        for car in cars_data["cars"]:
-            car_id = car["id"]
-            if is_car_available(car_id, start_date, end_date):
-                available_cars.append(car)
+        cars_by_name = await load_view_async(
+            get_file_path("cars.json"), "by_name", _cars_by_name
+        )
+        cars = cars_by_name.get(car_model.lower(), [])
+
+    epoch, bitmaps = await load_view_async(
+        get_file_path("bookings.json"), "bitmaps", _booking_bitmaps
+    )
+    requested_days = _requested_days(start_date, end_date, epoch)
 
-    return available_cars
+    return [car for car in cars if _is_available(car["id"], requested_days, bitmaps)]
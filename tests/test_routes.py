@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.routes import router
+from app.services import append_data
 
 client = TestClient(app)
 
@@ -45,9 +46,10 @@ def cleanup_bookings():
 
     yield  # Run the test
 
-    # After the test, clean up the mock_bookings.json file
+    # After the test, clean up the mock_bookings.json file and its log
     with open(file_path, "w") as f:
         json.dump({"bookings": []}, f, indent=4)
+    file_path.with_suffix(".ndjson").unlink(missing_ok=True)
 
 
 def test_get_all_cars(mocker, mock_list_cars):
@@ -158,3 +160,53 @@ def test_post_booking_conflict(mocker):
     # Check if the response status code is 400
     assert response.status_code == 400
     assert response.json() == {"detail": "Car already booked for the given time range."}
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [
+        ("2024-13-01", "2024-12-10"),
+        ("0001-01-01", "2024-12-10"),
+        ("2024-12-01", "9999-12-31"),
+        ("2024-12-10", "2024-12-01"),
+    ],
+)
+def test_post_booking_invalid_date(start_date, end_date):
+    payload = {
+        "car_id": 1,
+        "start_date": start_date,
+        "end_date": end_date,
+        "pickup_time": "08:00",
+        "dropoff_time": "18:00",
+    }
+    response = client.post("/booking/", json=payload)
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [("0001-01-01", "2024-12-10"), ("2024-11-28", "2024-11-26")],
+)
+def test_check_car_availability_rejects_invalid_dates(start_date, end_date):
+    response = client.get(
+        "/check_car_availability",
+        params={"start_date": start_date, "end_date": end_date},
+    )
+    assert response.status_code == 422
+
+
+def test_get_all_cars_follows_file_changes(mocker, tmp_path):
+    file_path = tmp_path / "cars.json"
+    file_path.write_text(json.dumps({"cars": [{"id": 1, "name": "SEAT Ibiza"}]}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+
+    assert client.get("/cars/").json() == {"cars": [{"id": 1, "name": "SEAT Ibiza"}]}
+    assert client.get("/cars/").json() == {"cars": [{"id": 1, "name": "SEAT Ibiza"}]}
+
+    file_path.write_text(json.dumps({"cars": []}))
+    assert client.get("/cars/").json() == {"cars": []}
+
+    append_data(file_path, "cars", {"id": 2, "name": "Volkswagen Polo"})
+    assert client.get("/cars/").json() == {
+        "cars": [{"id": 2, "name": "Volkswagen Polo"}]
+    }
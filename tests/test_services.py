@@ -0,0 +1,298 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+from threading import Thread
+
+import pytest
+
+from app.services import (
+    _CACHE,
+    _CACHE_LOCK,
+    _booking_bitmaps,
+    _bookings_by_car,
+    _overlaps,
+    append_data,
+    compact_data,
+    create_booking,
+    is_car_available,
+    list_cars_with_version,
+    load_data,
+    load_data_async,
+    load_view,
+    load_view_async,
+    save_data,
+)
+
+BOOKING = {
+    "car_id": 1,
+    "start_date": "2024-11-25",
+    "end_date": "2024-11-30",
+    "pickup_time": "09:00",
+    "dropoff_time": "18:00",
+}
+
+
+def test_load_data_is_cached_until_file_changes(tmp_path):
+    file_path = tmp_path / "cars.json"
+    file_path.write_text(json.dumps({"cars": [{"id": 1, "name": "SEAT Ibiza"}]}))
+
+    data = load_data(file_path)
+    assert load_data(file_path) is data
+
+    file_path.write_text(json.dumps({"cars": []}))
+    assert load_data(file_path) == {"cars": []}
+
+
+def test_save_data_refreshes_cache(tmp_path):
+    file_path = tmp_path / "bookings.json"
+    save_data(file_path, {"bookings": []})
+
+    assert load_data(file_path) == {"bookings": []}
+    assert json.loads(file_path.read_text()) == {"bookings": []}
+
+
+@pytest.mark.parametrize(
+    ("car_id", "start_date", "end_date", "available"),
+    [
+        (1, "2024-11-20", "2024-11-24", True),
+        (1, "2024-11-20", "2024-11-25", False),
+        (1, "2024-11-27", "2024-11-28", False),
+        (1, "2024-11-30", "2024-12-05", False),
+        (1, "2024-12-01", "2024-12-05", True),
+        (2, "2024-11-25", "2024-11-30", True),
+    ],
+)
+def test_is_car_available(car_id, start_date, end_date, available, mocker, tmp_path):
+    file_path = tmp_path / "bookings.json"
+    booking = {
+        "car_id": 1,
+        "start_date": "2024-11-25",
+        "end_date": "2024-11-30",
+        "pickup_time": "09:00",
+        "dropoff_time": "18:00",
+    }
+    file_path.write_text(json.dumps({"bookings": [booking]}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+
+    assert (
+        is_car_available(
+            car_id, date.fromisoformat(start_date), date.fromisoformat(end_date)
+        )
+        is available
+    )
+
+
+def test_create_booking_rejects_overlapping_dates(mocker, tmp_path):
+    (tmp_path / "cars.json").write_text(
+        json.dumps({"cars": [{"id": 1, "name": "SEAT Ibiza"}]})
+    )
+    (tmp_path / "bookings.json").write_text(json.dumps({"bookings": []}))
+    mocker.patch("app.services.get_file_path", side_effect=lambda name: tmp_path / name)
+
+    def book(start_date, end_date):
+        return asyncio.run(
+            create_booking(
+                1,
+                date.fromisoformat(start_date),
+                date.fromisoformat(end_date),
+                time(9),
+                time(18),
+            )
+        )
+
+    assert book("2024-11-25", "2024-11-30")
+    assert not book("2024-11-30", "2024-12-02")
+    assert book("2024-12-01", "2024-12-02")
+
+    bookings = load_data(tmp_path / "bookings.json")["bookings"]
+    assert [booking["start_date"] for booking in bookings] == [
+        "2024-11-25",
+        "2024-12-01",
+    ]
+
+
+def test_append_data_is_replayed_and_compacted(tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": [{"car_id": 1}]}))
+
+    append_data(file_path, "bookings", {"car_id": 2})
+    assert json.loads(file_path.read_text()) == {"bookings": [{"car_id": 1}]}
+    assert load_data(file_path) == {"bookings": [{"car_id": 1}, {"car_id": 2}]}
+
+    compact_data(file_path)
+    assert not (tmp_path / "bookings.ndjson").exists()
+    assert json.loads(file_path.read_text()) == {
+        "bookings": [{"car_id": 1}, {"car_id": 2}]
+    }
+
+
+def test_interrupted_compaction_does_not_replay_the_log(tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": []}))
+    append_data(file_path, "bookings", BOOKING)
+    log = (tmp_path / "bookings.ndjson").read_bytes()
+
+    # Crash after the file is replaced but before the log is deleted, then restart
+    compact_data(file_path)
+    (tmp_path / "bookings.ndjson").write_bytes(log)
+    del _CACHE[file_path]
+
+    assert load_data(file_path) == {"bookings": [BOOKING]}
+    assert not (tmp_path / "bookings.ndjson").exists()
+
+
+def test_failed_replay_is_not_applied_twice(mocker, tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": []}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+    load_view(file_path, "bitmaps", _booking_bitmaps)
+    (tmp_path / "bookings.ndjson").write_bytes(
+        b'{"bookings": {"car_id": 1, "start_date": "2024-11-31", "end_date": ""}}\n'
+    )
+
+    with pytest.raises(ValueError):
+        load_data(file_path)
+    for _ in range(3):
+        assert len(load_data(file_path)["bookings"]) == 1
+
+
+def test_append_data_recovers_from_a_torn_log(tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": []}))
+    # A garbled line, then a line cut short by a crashed write
+    (tmp_path / "bookings.ndjson").write_bytes(
+        b'{"bookings": {"car_id": 1}}\n{"bookings"\n{"bookings": {"car_id": 2}}\n'
+        b'{"bookings": {"car'
+    )
+
+    append_data(file_path, "bookings", {"car_id": 3})
+
+    assert load_data(file_path) == {
+        "bookings": [{"car_id": 1}, {"car_id": 2}, {"car_id": 3}]
+    }
+    log = (tmp_path / "bookings.ndjson").read_bytes()
+    assert log.endswith(b'{"car_id": 2}}\n{"bookings":{"car_id":3}}\n')
+
+
+def test_create_booking_concurrent_requests_book_once(mocker, tmp_path):
+    (tmp_path / "cars.json").write_text(
+        json.dumps({"cars": [{"id": 1, "name": "SEAT Ibiza"}]})
+    )
+    (tmp_path / "bookings.json").write_text(json.dumps({"bookings": []}))
+    mocker.patch("app.services.get_file_path", side_effect=lambda name: tmp_path / name)
+
+    def book(_):
+        return asyncio.run(
+            create_booking(1, date(2024, 11, 25), date(2024, 11, 30), time(9), time(18))
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(book, range(16)))
+
+    assert results.count(True) == 1
+    assert len(load_data(tmp_path / "bookings.json")["bookings"]) == 1
+
+
+def test_appended_bookings_update_the_views_of_an_empty_file(mocker, tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": []}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+
+    assert is_car_available(1, date(2024, 11, 25), date(2024, 11, 30))
+    assert load_view(file_path, "bitmaps", _booking_bitmaps) == (0, {})
+
+    append_data(file_path, "bookings", BOOKING)
+
+    epoch, bitmaps = load_view(file_path, "bitmaps", _booking_bitmaps)
+    assert epoch == date(2024, 11, 25).toordinal()
+    assert bitmaps[1].bit_length() == 6
+    assert not is_car_available(1, date(2024, 11, 30), date(2024, 12, 1))
+    assert is_car_available(1, date(2024, 12, 1), date(2024, 12, 1))
+
+
+def test_appended_bookings_move_the_epoch_back(mocker, tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": [BOOKING]}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+
+    bookings_by_car = load_view(file_path, "bookings_by_car", _bookings_by_car)
+    assert is_car_available(1, date(2024, 11, 1), date(2024, 11, 5))
+
+    append_data(
+        file_path,
+        "bookings",
+        {**BOOKING, "start_date": "2024-11-01", "end_date": "2024-11-05"},
+    )
+
+    epoch, _ = load_view(file_path, "bitmaps", _booking_bitmaps)
+    assert epoch == date(2024, 11, 1).toordinal()
+    assert not is_car_available(1, date(2024, 11, 5), date(2024, 11, 6))
+    assert is_car_available(1, date(2024, 11, 6), date(2024, 11, 24))
+    assert not is_car_available(1, date(2024, 11, 24), date(2024, 11, 25))
+
+    car_ranges = bookings_by_car[1]
+    assert _overlaps(
+        car_ranges, date(2024, 11, 3).toordinal(), date(2024, 11, 3).toordinal()
+    )
+    assert not _overlaps(
+        car_ranges, date(2024, 11, 6).toordinal(), date(2024, 11, 24).toordinal()
+    )
+
+
+def test_cached_reads_do_not_wait_for_the_cache_lock(mocker, tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": [BOOKING]}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+    load_view(file_path, "bitmaps", _booking_bitmaps)
+
+    results = []
+
+    def read():
+        results.append(asyncio.run(load_data_async(file_path)))
+        results.append(
+            asyncio.run(load_view_async(file_path, "bitmaps", _booking_bitmaps))
+        )
+
+    # A worker thread holding the lock, e.g. while parsing a file, must not block
+    # reads of cached data
+    with _CACHE_LOCK:
+        reader = Thread(target=read)
+        reader.start()
+        reader.join(timeout=5)
+
+    assert not reader.is_alive()
+    assert results == [
+        {"bookings": [BOOKING]},
+        load_view(file_path, "bitmaps", _booking_bitmaps),
+    ]
+
+
+def test_save_data_replaces_the_file(tmp_path):
+    file_path = tmp_path / "bookings.json"
+    file_path.write_text(json.dumps({"bookings": []}))
+    file_path.chmod(0o640)
+    inode = file_path.stat().st_ino
+
+    save_data(file_path, {"bookings": [BOOKING]})
+
+    assert file_path.stat().st_ino != inode
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert json.loads(file_path.read_text()) == {"bookings": [BOOKING]}
+    assert [path.name for path in tmp_path.iterdir()] == ["bookings.json"]
+
+
+def test_list_cars_with_version_follows_appended_cars(mocker, tmp_path):
+    file_path = tmp_path / "cars.json"
+    file_path.write_text(json.dumps({"cars": []}))
+    mocker.patch("app.services.get_file_path", return_value=file_path)
+
+    version, cars = asyncio.run(list_cars_with_version())
+    assert version[0] == file_path
+    assert cars == []
+
+    append_data(file_path, "cars", {"id": 1, "name": "SEAT Ibiza"})
+
+    new_version, cars = asyncio.run(list_cars_with_version())
+    assert new_version != version
+    assert cars == [{"id": 1, "name": "SEAT Ibiza"}]